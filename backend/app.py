@@ -4,8 +4,14 @@ FastAPI server for F1 data using FastF1 library
 """
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from brotli_asgi import BrotliMiddleware
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, timedelta
+import asyncio
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, List
 import sys
 import os
@@ -14,48 +20,94 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from services.fastf1_service import FastF1Service
-from database import get_db, init_db, ClubMember, RaceReaction
+from database import get_db, ClubMember, RaceReaction
 from models import RaceReactionCreate, RaceReactionResponse, ClubMemberCreate, ClubMemberResponse
-from sqlalchemy.orm import Session
+from cache import (
+    init_cache, singleflight, stale_key, keep_stale, serve_stale, StaleCacheHit,
+    SCHEDULE_TTL, STANDINGS_TTL, NEXT_RACE_TTL
+)
+from fastapi_cache.decorator import cache
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 
-# Configure logging
+# Configure logging: request handlers only enqueue records,
+# a background listener thread does the actual (blocking) stdout writes
+log_queue = queue.SimpleQueue()
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = QueueListener(log_queue, log_handler)
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Full format is applied by the listener
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=os.getenv('LOG_LEVEL', 'WARNING').upper(),
+    handlers=[queue_handler]
 )
+log_listener.start()
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="NashfyPitStop API",
     description="F1 data API using FastF1 library",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS - Allow frontend to access API
+# localhost/127.0.0.1 on any port for development, plus comma-separated CORS_ORIGINS for deployed frontends
+CORS_ORIGINS = frozenset(o.strip() for o in os.getenv('CORS_ORIGINS', '').split(',') if o.strip())
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:8000",
-        "http://localhost:3000",
-        "http://127.0.0.1:8000",
-        "http://127.0.0.1:3000",
-        "file://",  # For local file access
-        "*"  # Allow all origins for development (restrict in production)
-    ],
+    allow_origins=CORS_ORIGINS,
+    allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress large payloads (telemetry, lap times): Brotli when the client accepts it,
+# otherwise GZip. GZip is outermost and skips responses Brotli already encoded.
+app.add_middleware(BrotliMiddleware, minimum_size=1024, gzip_fallback=False)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize FastF1 service
 fastf1_service = FastF1Service()
 
-# Initialize database on startup
+# How often memoized schedules are dropped so race statuses roll over (seconds)
+SCHEDULE_REFRESH_INTERVAL = 3600
+
+async def warm_cache():
+    """Pre-fetch the current season schedule into the response cache"""
+    try:
+        await get_race_schedule(year=datetime.now().year, include_sessions=False)
+    except Exception as e:
+        logger.warning("Could not warm schedule cache: %s", e)
+
+async def refresh_schedule():
+    """Periodically drop memoized schedules so race statuses roll over (rebuilt on the next request)"""
+    while True:
+        await asyncio.sleep(SCHEDULE_REFRESH_INTERVAL)
+        fastf1_service.invalidate_schedule_cache()
+
+# Initialize response cache on startup (schema is managed by Alembic migrations)
 @app.on_event("startup")
 async def startup_event():
-    init_db()
+    init_cache()
+    # Warm in the background so the worker starts serving immediately
+    app.state.warm_cache_task = asyncio.create_task(warm_cache())
+    app.state.schedule_task = asyncio.create_task(refresh_schedule())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    app.state.schedule_task.cancel()
+    await fastf1_service.close()
+    log_listener.stop()
+
+@app.exception_handler(StaleCacheHit)
+async def stale_cache_handler(request, exc: StaleCacheHit):
+    """Serve the last good response when FastF1 is unreachable"""
+    return ORJSONResponse(content=exc.payload, headers={"X-Cache": "stale"})
 
 @app.get("/")
 async def root():
@@ -67,6 +119,8 @@ async def root():
     }
 
 @app.get("/api/race-schedule")
+@cache(expire=SCHEDULE_TTL)
+@singleflight
 async def get_race_schedule(
     year: int = Query(2025, description="F1 season year"),
     include_sessions: bool = Query(False, description="Include practice, qualifying sessions")
@@ -75,23 +129,27 @@ async def get_race_schedule(
     Get F1 race schedule for a given year
     Returns list of races with dates, times, and circuit information
     """
+    key = stale_key("race-schedule", year=year, include_sessions=include_sessions)
     try:
-        logger.info(f"Fetching race schedule for year {year}")
+        logger.info("Fetching race schedule for year %s", year)
         schedule = await fastf1_service.get_race_schedule(year, include_sessions)
-        return {
+        return await keep_stale(key, {
             "success": True,
             "year": year,
             "races": schedule,
             "count": len(schedule)
-        }
+        })
     except Exception as e:
-        logger.error(f"Error fetching race schedule: {str(e)}")
+        logger.error("Error fetching race schedule: %s", e)
+        await serve_stale(key)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch race schedule: {str(e)}"
         )
 
 @app.get("/api/race-results")
+@cache(expire=STANDINGS_TTL)
+@singleflight
 async def get_race_results(
     year: int = Query(2025, description="F1 season year"),
     round: Optional[int] = Query(None, description="Specific race round number"),
@@ -100,22 +158,26 @@ async def get_race_results(
     """
     Get race results for a season or specific race
     """
+    key = stale_key("race-results", year=year, round=round, latest=latest)
     try:
-        logger.info(f"Fetching race results for year {year}, round {round}")
+        logger.info("Fetching race results for year %s, round %s", year, round)
         results = await fastf1_service.get_race_results(year, round, latest)
-        return {
+        return await keep_stale(key, {
             "success": True,
             "year": year,
             "results": results
-        }
+        })
     except Exception as e:
-        logger.error(f"Error fetching race results: {str(e)}")
+        logger.error("Error fetching race results: %s", e)
+        await serve_stale(key)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch race results: {str(e)}"
         )
 
 @app.get("/api/driver-standings")
+@cache(expire=STANDINGS_TTL)
+@singleflight
 async def get_driver_standings(
     year: int = Query(2025, description="F1 season year"),
     after_round: Optional[int] = Query(None, description="Standings after specific round")
@@ -123,22 +185,26 @@ async def get_driver_standings(
     """
     Get driver championship standings
     """
+    key = stale_key("driver-standings", year=year, after_round=after_round)
     try:
-        logger.info(f"Fetching driver standings for year {year}")
+        logger.info("Fetching driver standings for year %s", year)
         standings = await fastf1_service.get_driver_standings(year, after_round)
-        return {
+        return await keep_stale(key, {
             "success": True,
             "year": year,
             "standings": standings
-        }
+        })
     except Exception as e:
-        logger.error(f"Error fetching driver standings: {str(e)}")
+        logger.error("Error fetching driver standings: %s", e)
+        await serve_stale(key)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch driver standings: {str(e)}"
         )
 
 @app.get("/api/constructor-standings")
+@cache(expire=STANDINGS_TTL)
+@singleflight
 async def get_constructor_standings(
     year: int = Query(2025, description="F1 season year"),
     after_round: Optional[int] = Query(None, description="Standings after specific round")
@@ -146,21 +212,28 @@ async def get_constructor_standings(
     """
     Get constructor championship standings
     """
+    key = stale_key("constructor-standings", year=year, after_round=after_round)
     try:
-        logger.info(f"Fetching constructor standings for year {year}")
+        logger.info("Fetching constructor standings for year %s", year)
         standings = await fastf1_service.get_constructor_standings(year, after_round)
-        return {
+        return await keep_stale(key, {
             "success": True,
             "year": year,
             "standings": standings
-        }
+        })
     except Exception as e:
-        logger.error(f"Error fetching constructor standings: {str(e)}")
+        logger.error("Error fetching constructor standings: %s", e)
+        await serve_stale(key)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch constructor standings: {str(e)}"
         )
 
+@singleflight
+async def fetch_telemetry(year: int, round: int, session: str, driver: Optional[str]):
+    """Telemetry payload, shared by concurrent identical requests (each still gets its own response)"""
+    return await fastf1_service.get_telemetry(year, round, session, driver)
+
 @app.get("/api/telemetry")
 async def get_telemetry(
     year: int = Query(2025, description="F1 season year"),
@@ -173,23 +246,26 @@ async def get_telemetry(
     Note: Telemetry data is only available for completed sessions
     """
     try:
-        logger.info(f"Fetching telemetry for {year} Round {round}, Session {session}, Driver {driver}")
-        telemetry = await fastf1_service.get_telemetry(year, round, session, driver)
-        return {
+        logger.info("Fetching telemetry for %s Round %s, Session %s, Driver %s", year, round, session, driver)
+        telemetry = await fetch_telemetry(year, round, session, driver)
+        # Channels are numpy arrays; ORJSONResponse serializes them natively (jsonable_encoder can't).
+        # Built per request: compression middleware edits the response headers in place
+        return ORJSONResponse({
             "success": True,
             "year": year,
             "round": round,
             "session": session,
             "telemetry": telemetry
-        }
+        })
     except Exception as e:
-        logger.error(f"Error fetching telemetry: {str(e)}")
+        logger.error("Error fetching telemetry: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch telemetry: {str(e)}"
         )
 
 @app.get("/api/lap-times")
+@singleflight
 async def get_lap_times(
     year: int = Query(2025, description="F1 season year"),
     round: int = Query(1, description="Race round number"),
@@ -200,7 +276,7 @@ async def get_lap_times(
     Get lap times for a specific session
     """
     try:
-        logger.info(f"Fetching lap times for {year} Round {round}, Session {session}")
+        logger.info("Fetching lap times for %s Round %s, Session %s", year, round, session)
         lap_times = await fastf1_service.get_lap_times(year, round, session, driver)
         return {
             "success": True,
@@ -210,13 +286,14 @@ async def get_lap_times(
             "lap_times": lap_times
         }
     except Exception as e:
-        logger.error(f"Error fetching lap times: {str(e)}")
+        logger.error("Error fetching lap times: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch lap times: {str(e)}"
         )
 
 @app.get("/api/race-info")
+@singleflight
 async def get_race_info(
     year: int = Query(2025, description="F1 season year"),
     round: int = Query(1, description="Race round number"),
@@ -226,20 +303,21 @@ async def get_race_info(
     Get comprehensive race information (timing, track status, session status, etc.)
     """
     try:
-        logger.info(f"Fetching race info for {year} Round {round}, Session {session}")
+        logger.info("Fetching race info for %s Round %s, Session %s", year, round, session)
         race_info = await fastf1_service.get_race_info(year, round, session)
         return {
             "success": True,
             "race_info": race_info
         }
     except Exception as e:
-        logger.error(f"Error fetching race info: {str(e)}")
+        logger.error("Error fetching race info: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch race info: {str(e)}"
         )
 
 @app.get("/api/track-status")
+@singleflight
 async def get_track_status(
     year: int = Query(2025, description="F1 season year"),
     round: int = Query(1, description="Race round number"),
@@ -249,33 +327,37 @@ async def get_track_status(
     Get track status (flags, safety car, etc.)
     """
     try:
-        logger.info(f"Fetching track status for {year} Round {round}, Session {session}")
+        logger.info("Fetching track status for %s Round %s, Session %s", year, round, session)
         status = await fastf1_service.get_track_status(year, round, session)
         return {
             "success": True,
             "track_status": status
         }
     except Exception as e:
-        logger.error(f"Error fetching track status: {str(e)}")
+        logger.error("Error fetching track status: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch track status: {str(e)}"
         )
 
 @app.get("/api/next-race")
+@cache(expire=NEXT_RACE_TTL)
+@singleflight
 async def get_next_race():
     """
     Get information about the next upcoming race
     """
+    key = stale_key("next-race")
     try:
         logger.info("Fetching next race information")
         next_race = await fastf1_service.get_next_race()
-        return {
+        return await keep_stale(key, {
             "success": True,
             "race": next_race
-        }
+        })
     except Exception as e:
-        logger.error(f"Error fetching next race: {str(e)}")
+        logger.error("Error fetching next race: %s", e)
+        await serve_stale(key)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch next race: {str(e)}"
@@ -285,7 +367,7 @@ async def get_next_race():
 @app.post("/api/race-reactions", response_model=RaceReactionResponse)
 async def create_race_reaction(
     reaction: RaceReactionCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a race reaction/comment
@@ -293,11 +375,12 @@ async def create_race_reaction(
     """
     try:
         # Check if user is a club member
-        member = db.query(ClubMember).filter(
+        result = await db.execute(select(ClubMember).where(
             ClubMember.email == reaction.member_email,
             ClubMember.status == 'approved',
             ClubMember.is_active == True
-        ).first()
+        ))
+        member = result.scalars().first()
         
         if not member:
             raise HTTPException(
@@ -307,7 +390,7 @@ async def create_race_reaction(
         
         # Create reaction
         db_reaction = RaceReaction(
-            member_id=member.id,
+            member=member,
             race_year=reaction.race_year,
             race_round=reaction.race_round,
             race_name=reaction.race_name,
@@ -316,25 +399,14 @@ async def create_race_reaction(
         )
         
         db.add(db_reaction)
-        db.commit()
-        db.refresh(db_reaction)
+        await db.commit()
         
-        return RaceReactionResponse(
-            id=db_reaction.id,
-            member_name=member.name,
-            member_email=member.email,
-            race_year=db_reaction.race_year,
-            race_round=db_reaction.race_round,
-            race_name=db_reaction.race_name,
-            comment=db_reaction.comment,
-            reaction_type=db_reaction.reaction_type,
-            created_at=db_reaction.created_at
-        )
+        return db_reaction
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating reaction: {str(e)}")
-        db.rollback()
+        logger.error("Error creating reaction: %s", e)
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Failed to create reaction: {str(e)}"
@@ -344,33 +416,32 @@ async def create_race_reaction(
 async def get_race_reactions(
     race_year: int = Query(..., description="Race year"),
     race_round: int = Query(..., description="Race round number"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get all reactions for a specific race
     """
     try:
-        reactions = db.query(RaceReaction).join(ClubMember).filter(
-            RaceReaction.race_year == race_year,
-            RaceReaction.race_round == race_round
-        ).order_by(RaceReaction.created_at.desc()).all()
-        
-        return [
-            RaceReactionResponse(
-                id=r.id,
-                member_name=r.member.name,
-                member_email=r.member.email,
-                race_year=r.race_year,
-                race_round=r.race_round,
-                race_name=r.race_name,
-                comment=r.comment,
-                reaction_type=r.reaction_type,
-                created_at=r.created_at
-            )
-            for r in reactions
-        ]
+        # Trusted read: project straight to rows and skip ORM objects and Pydantic validation
+        result = await db.execute(
+            select(
+                RaceReaction.id,
+                ClubMember.name.label("member_name"),
+                ClubMember.email.label("member_email"),
+                RaceReaction.race_year,
+                RaceReaction.race_round,
+                RaceReaction.race_name,
+                RaceReaction.comment,
+                RaceReaction.reaction_type,
+                RaceReaction.created_at
+            ).join(ClubMember).where(
+                RaceReaction.race_year == race_year,
+                RaceReaction.race_round == race_round
+            ).order_by(RaceReaction.created_at.desc())
+        )
+        return ORJSONResponse([dict(row) for row in result.mappings()])
     except Exception as e:
-        logger.error(f"Error fetching reactions: {str(e)}")
+        logger.error("Error fetching reactions: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch reactions: {str(e)}"
@@ -379,14 +450,15 @@ async def get_race_reactions(
 @app.post("/api/club-members", response_model=ClubMemberResponse)
 async def create_club_member(
     member: ClubMemberCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Join the club (create a new club member)
     """
     try:
         # Check if email already exists
-        existing = db.query(ClubMember).filter(ClubMember.email == member.email).first()
+        result = await db.execute(select(ClubMember).where(ClubMember.email == member.email))
+        existing = result.scalars().first()
         if existing:
             raise HTTPException(
                 status_code=400,
@@ -402,22 +474,14 @@ async def create_club_member(
         )
         
         db.add(db_member)
-        db.commit()
-        db.refresh(db_member)
+        await db.commit()
         
-        return ClubMemberResponse(
-            id=db_member.id,
-            name=db_member.name,
-            email=db_member.email,
-            city=db_member.city,
-            status=db_member.status,
-            submitted_at=db_member.submitted_at
-        )
+        return db_member
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating club member: {str(e)}")
-        db.rollback()
+        logger.error("Error creating club member: %s", e)
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Failed to join club: {str(e)}"
@@ -426,13 +490,16 @@ async def create_club_member(
 @app.get("/api/club-members/check")
 async def check_club_member(
     email: str = Query(..., description="Email to check"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Check if an email is registered and approved as a club member
     """
     try:
-        member = db.query(ClubMember).filter(ClubMember.email == email).first()
+        result = await db.execute(
+            select(ClubMember.name, ClubMember.status, ClubMember.is_active).where(ClubMember.email == email)
+        )
+        member = result.first()
         
         if not member:
             return {
@@ -448,7 +515,7 @@ async def check_club_member(
             "name": member.name
         }
     except Exception as e:
-        logger.error(f"Error checking club member: {str(e)}")
+        logger.error("Error checking club member: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to check membership: {str(e)}"
@@ -456,5 +523,14 @@ async def check_club_member(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools ship with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+        access_log=False
+    )
 
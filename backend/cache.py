@@ -0,0 +1,114 @@
+"""
+Response caching for NashfyPitStop
+Redis-backed cache for the FastF1 read endpoints
+"""
+import os
+import asyncio
+import logging
+from functools import wraps
+from typing import Any, Dict, Tuple
+import orjson
+from dotenv import load_dotenv
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder
+from starlette.responses import Response
+from redis import asyncio as aioredis
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Cache configuration
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+CACHE_PREFIX = "nfps"
+
+# Cache TTLs in seconds
+SCHEDULE_TTL = 86400     # Schedule changes at most daily
+STANDINGS_TTL = 3600     # Standings/results move only after a session
+NEXT_RACE_TTL = 600      # Countdown must stay reasonably fresh
+STALE_TTL = 86400        # Last good response, served when FastF1 is unreachable
+
+# Query parameters that identify a cached FastF1 response
+CACHE_KEY_PARAMS = ("year", "round", "latest", "after_round", "include_sessions")
+
+# In-flight FastF1 requests, keyed by endpoint and parameters
+_inflight: Dict[Tuple, asyncio.Task] = {}
+
+class ORJSONCoder(Coder):
+    """Encode cached responses with orjson (native datetimes and numpy arrays, read back as plain JSON)"""
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, Response):
+            return value.body
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        return orjson.loads(value)
+
+def f1_key_builder(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None) -> str:
+    """Build a readable cache key from the endpoint name and its F1 query parameters"""
+    kwargs = kwargs or {}
+    params = ":".join(f"{name}={kwargs[name]}" for name in CACHE_KEY_PARAMS if name in kwargs)
+    return f"{FastAPICache.get_prefix()}:{namespace}:{func.__name__}:{params}"
+
+def singleflight(func):
+    """
+    Collapse concurrent identical calls into a single upstream request.
+    Callers arriving while a call is in flight await its result instead of starting their own.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            _inflight[key] = task
+            task.add_done_callback(lambda _: _inflight.pop(key, None))
+        # Shield so one disconnecting client doesn't cancel the call for everyone else
+        return await asyncio.shield(task)
+
+    return wrapper
+
+def init_cache():
+    """Initialize the Redis cache backend"""
+    redis = aioredis.from_url(REDIS_URL)
+    FastAPICache.init(RedisBackend(redis), prefix=CACHE_PREFIX, coder=ORJSONCoder, key_builder=f1_key_builder)
+
+class StaleCacheHit(Exception):
+    """
+    Carries the last good response for a failed request.
+    Raised rather than returned so the cache decorator does not store it as fresh.
+    """
+
+    def __init__(self, payload):
+        super().__init__("Serving stale cached response")
+        self.payload = payload
+
+def stale_key(endpoint: str, **params) -> str:
+    """Build the key holding the last good response for an endpoint"""
+    key = f"{CACHE_PREFIX}:stale:{endpoint}"
+    for name, value in params.items():
+        key += f":{name}={value}"
+    return key
+
+async def keep_stale(key: str, payload):
+    """Store a successful response as the stale fallback and return it unchanged"""
+    try:
+        await FastAPICache.get_backend().set(key, FastAPICache.get_coder().encode(payload), STALE_TTL)
+    except Exception as e:
+        logger.warning("Could not store stale response for %s: %s", key, e)
+    return payload
+
+async def serve_stale(key: str):
+    """Raise StaleCacheHit with the last good response for key, if one is stored"""
+    try:
+        cached = await FastAPICache.get_backend().get(key)
+    except Exception as e:
+        logger.warning("Could not read stale response for %s: %s", key, e)
+        return
+    if cached is not None:
+        logger.warning("Upstream failed, serving stale response for %s", key)
+        raise StaleCacheHit(FastAPICache.get_coder().decode(cached))
@@ -1,9 +1,11 @@
 """
 Database configuration and models for NashfyPitStop
 """
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Float, Index
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import relationship
 from datetime import datetime
 import os
 from dotenv import load_dotenv
@@ -19,13 +21,28 @@ DB_USER = os.getenv('DB_USER', 'root')
 DB_PASSWORD = os.getenv('DB_PASSWORD', '')
 DB_NAME = os.getenv('DB_NAME', 'nashfypitstop')
 
-DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# Connection pool (per worker process)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '40'))
+DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '10'))
 
-# Create engine
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, pool_recycle=3600)
+DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"  # Sync driver, used by Alembic
+ASYNC_DATABASE_URL = f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# Create async engine so queries don't block the event loop
+# LIFO reuse keeps hot connections hot and lets idle ones expire server-side
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_use_lifo=True
+)
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 # Database Models
 class ClubMember(Base):
@@ -49,26 +66,25 @@ class RaceReaction(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     member_id = Column(Integer, ForeignKey('club_members.id'), nullable=False)
-    race_year = Column(Integer, nullable=False, index=True)
-    race_round = Column(Integer, nullable=False, index=True)
+    race_year = Column(Integer, nullable=False)
+    race_round = Column(Integer, nullable=False)
     race_name = Column(String(255))
     comment = Column(Text)
     reaction_type = Column(String(50))  # emoji or text reaction
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
     member = relationship("ClubMember", back_populates="reactions")
+    member_name = association_proxy("member", "name")
+    member_email = association_proxy("member", "email")
+    
+    # Per-race listing filters on year/round and orders by created_at
+    __table_args__ = (
+        Index('ix_reactions_year_round_created', 'race_year', 'race_round', 'created_at'),
+    )
 
-def init_db():
-    """Initialize database - create all tables"""
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created successfully")
-
-def get_db():
+async def get_db():
     """Get database session"""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
@@ -0,0 +1,15 @@
+"""
+Gunicorn configuration for production
+Run from the backend directory: gunicorn -c gunicorn.conf.py app:app
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:8000')
+
+# One Uvicorn worker process per core (2 * cores + 1); each runs its own uvloop/httptools event loop
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'uvicorn.workers.UvicornWorker'
+
+# Match typical browser/load balancer keep-alive so connections get reused
+keepalive = 75
@@ -0,0 +1,57 @@
+"""Initial schema (club members and race reactions)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+
+Databases created earlier by init_db() already match this revision;
+mark them with `alembic stamp 0001` before upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'club_members',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('city', sa.String(length=100), nullable=True),
+        sa.Column('submitted_at', sa.DateTime(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_club_members_id', 'club_members', ['id'])
+    op.create_index('ix_club_members_email', 'club_members', ['email'], unique=True)
+
+    op.create_table(
+        'race_reactions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('member_id', sa.Integer(), nullable=False),
+        sa.Column('race_year', sa.Integer(), nullable=False),
+        sa.Column('race_round', sa.Integer(), nullable=False),
+        sa.Column('race_name', sa.String(length=255), nullable=True),
+        sa.Column('comment', sa.Text(), nullable=True),
+        sa.Column('reaction_type', sa.String(length=50), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['member_id'], ['club_members.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_race_reactions_id', 'race_reactions', ['id'])
+    op.create_index('ix_race_reactions_race_year', 'race_reactions', ['race_year'])
+    op.create_index('ix_race_reactions_race_round', 'race_reactions', ['race_round'])
+    op.create_index('ix_race_reactions_created_at', 'race_reactions', ['created_at'])
+
+
+def downgrade():
+    op.drop_table('race_reactions')
+    op.drop_table('club_members')
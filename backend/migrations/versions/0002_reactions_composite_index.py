@@ -0,0 +1,35 @@
+"""Composite index for per-race reaction listing
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+
+get_race_reactions filters on (race_year, race_round) and orders by
+created_at, so a single composite index replaces the per-column ones.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_reactions_year_round_created',
+        'race_reactions',
+        ['race_year', 'race_round', 'created_at']
+    )
+    op.drop_index('ix_race_reactions_race_year', table_name='race_reactions')
+    op.drop_index('ix_race_reactions_race_round', table_name='race_reactions')
+    op.drop_index('ix_race_reactions_created_at', table_name='race_reactions')
+
+
+def downgrade():
+    op.create_index('ix_race_reactions_created_at', 'race_reactions', ['created_at'])
+    op.create_index('ix_race_reactions_race_round', 'race_reactions', ['race_round'])
+    op.create_index('ix_race_reactions_race_year', 'race_reactions', ['race_year'])
+    op.drop_index('ix_reactions_year_round_created', table_name='race_reactions')
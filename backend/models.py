@@ -1,12 +1,15 @@
 """
 Pydantic models for API requests/responses
 """
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, constr
 from typing import Optional
 from datetime import datetime
 
+# Cheap shape check for hot paths; membership is verified against the database anyway
+SimpleEmail = constr(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)
+
 class RaceReactionCreate(BaseModel):
-    member_email: EmailStr
+    member_email: SimpleEmail
     race_year: int
     race_round: int
     race_name: Optional[str] = None
@@ -24,8 +27,7 @@ class RaceReactionResponse(BaseModel):
     reaction_type: Optional[str]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ClubMemberCreate(BaseModel):
     name: str
@@ -40,6 +42,5 @@ class ClubMemberResponse(BaseModel):
     status: str
     submitted_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
@@ -2,19 +2,152 @@
 FastF1 Service
 Handles all FastF1 library operations and data processing
 """
+import aiohttp
 import fastf1
+from cachetools import LRUCache, TTLCache
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import logging
 import asyncio
-from functools import lru_cache
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, wraps
+from diskcache import Cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 # Enable FastF1 caching for better performance
+os.makedirs('./cache', exist_ok=True)  # FastF1 refuses a missing cache directory
 fastf1.Cache.enable_cache('./cache')  # Cache directory
 
+# Telemetry channels returned by get_telemetry: name -> (FastF1 column, compact dtype)
+TELEMETRY_CHANNELS = {
+    "time": ('Time', 'int64'),
+    "speed": ('Speed', 'float32'),
+    "rpm": ('RPM', 'int32'),
+    "throttle": ('Throttle', 'float32'),
+    "brake": ('Brake', 'bool'),
+    "gear": ('nGear', 'int8'),
+    "drs": ('DRS', 'int8'),
+}
+
+# Telemetry/lap-time payloads kept in the API process: current season for an hour,
+# past seasons (immutable) until evicted
+PAYLOAD_CACHE_SIZE = 64
+PAYLOAD_CACHE_TTL = 3600
+
+# Jolpica (Ergast-compatible) API: schedules and official standings in one request each
+JOLPICA_URL = os.getenv('JOLPICA_URL', 'https://api.jolpi.ca/ergast/f1')
+JOLPICA_TIMEOUT = 10  # seconds, before falling back to FastF1
+
+# Persistent cache of processed schedule/results/standings, shared by all workers
+APP_CACHE_DIR = os.getenv('APP_CACHE_DIR', './cache/app')
+APP_CACHE_TTL_PAST = 86400      # past seasons no longer change
+APP_CACHE_TTL_CURRENT = 300     # current season may change during a race weekend
+app_cache = Cache(APP_CACHE_DIR)
+
+def _app_cache_expire(year: int, immutable: bool = False) -> Optional[int]:
+    """Cache lifetime for a season's data (None = never expires)"""
+    if year < datetime.now().year:
+        return None if immutable else APP_CACHE_TTL_PAST
+    return APP_CACHE_TTL_CURRENT
+
+class Partial:
+    """A fetcher result built from incomplete data: returned as usual, but only cached briefly"""
+    
+    def __init__(self, value):
+        self.value = value
+
+def disk_cached(name: str, immutable: bool = False):
+    """Cache a sync fetcher's result on disk, keyed by name and arguments (first argument is the year)"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, year, *args):
+            key = (name, year, *args)
+            try:
+                hit = app_cache.get(key)
+            except Exception as e:
+                logger.warning("App cache read failed for %s: %s", key, e)
+                hit = None
+            if hit is not None:
+                return hit
+            
+            result = func(self, year, *args)
+            expire = _app_cache_expire(year, immutable)
+            if isinstance(result, Partial):
+                result, expire = result.value, APP_CACHE_TTL_CURRENT
+            # Don't pin error payloads
+            if not (isinstance(result, dict) and "error" in result):
+                try:
+                    app_cache.set(key, result, expire=expire)
+                except Exception as e:
+                    logger.warning("App cache write failed for %s: %s", key, e)
+            return result
+        return wrapper
+    return decorator
+
+# Loaded sessions kept in memory in the API process; telemetry pool workers keep only a
+# couple each, since any worker may get any job and each would load its own copy
+SESSION_CACHE_SIZE = int(os.getenv('FASTF1_SESSION_CACHE_SIZE', 4))
+WORKER_SESSION_CACHE_SIZE = 2
+_session_cache_size = SESSION_CACHE_SIZE  # lowered by _init_worker in pool processes
+SESSION_FINAL_AFTER = timedelta(hours=4)  # sessions younger than this may still gain data
+_sessions: OrderedDict = OrderedDict()
+_sessions_lock = threading.Lock()
+
+# Finished races whose results are memoized in process
+COMPLETED_RESULTS_SIZE = 64
+
+def _get_session(year: int, round_num: int, session_type: str):
+    """Loaded FastF1 session, reused from a small LRU once the session is over"""
+    key = (year, round_num, session_type)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is not None:
+            _sessions.move_to_end(key)
+            return session
+    
+    # Load outside the lock so different sessions load in parallel
+    session = fastf1.get_session(year, round_num, session_type)
+    session.load()
+    
+    if pd.notna(session.date) and session.date < datetime.utcnow() - SESSION_FINAL_AFTER:
+        with _sessions_lock:
+            _sessions[key] = session
+            _sessions.move_to_end(key)
+            while len(_sessions) > _session_cache_size:
+                _sessions.popitem(last=False)
+    return session
+
+def _get_results_session(year: int, round_num: int):
+    """Race session with results only (no laps, telemetry, weather or messages), kept out of the LRU"""
+    with _sessions_lock:
+        session = _sessions.get((year, round_num, 'R'))
+    if session is not None:
+        return session
+    
+    session = fastf1.get_session(year, round_num, 'R')
+    session.load(laps=False, telemetry=False, weather=False, messages=False)
+    return session
+
+def _init_worker():
+    """Set up a pool worker process: a small session LRU, and logging straight to stderr (the queue listener only runs in the parent)"""
+    global _session_cache_size
+    _session_cache_size = WORKER_SESSION_CACHE_SIZE
+    logging.basicConfig(
+        level=logging.getLogger().level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        force=True
+    )
+
 class FastF1Service:
     """Service for interacting with FastF1 library"""
     
@@ -23,19 +156,140 @@ class FastF1Service:
         logger.info("Initializing FastF1 service")
         # Set timezone for EAT (UTC+3)
         self.eat_offset = timedelta(hours=3)
+        self._configure_http_pool()
+        # Telemetry/lap parsing is CPU-bound pandas work; run it outside the GIL
+        self.cpu_pool = self._new_cpu_pool()
+        # Blocking FastF1 calls get their own bounded pool; the semaphore caps how many
+        # session loads (hundreds of MB each) are in flight across both pools
+        io_workers = int(os.getenv('FASTF1_IO_WORKERS', 4))
+        self._pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix='fastf1')
+        self._sem = asyncio.Semaphore(io_workers)
+        # Per-round loads of season-wide jobs, shared by all of them (a job waiting on its rounds
+        # holds a _pool thread, so they can't be queued back onto _pool)
+        self._round_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix='fastf1-round')
+        self._payload_cache = TTLCache(maxsize=PAYLOAD_CACHE_SIZE, ttl=PAYLOAD_CACHE_TTL)
+        self._past_payload_cache = LRUCache(maxsize=PAYLOAD_CACHE_SIZE)
+        # Shared Jolpica client, created on first use inside the event loop
+        self._http: Optional[aiohttp.ClientSession] = None
+        # In-process memo in front of the disk cache; cleared by invalidate_schedule_cache()
+        self._cached_schedule = lru_cache(maxsize=16)(self._schedule_tuple)
+        # Results of races that have been over for a while never change
+        self._completed_results = LRUCache(maxsize=COMPLETED_RESULTS_SIZE)
+        self._completed_results_lock = threading.Lock()  # read and written from the worker threads
+    
+    def _new_cpu_pool(self) -> ProcessPoolExecutor:
+        """Process pool for telemetry/lap parsing"""
+        # Spawned, not forked from this multithreaded process: a lock held by another thread
+        # at fork time (session LRU, FastF1's HTTP cache) would stay held in the child forever
+        return ProcessPoolExecutor(
+            max_workers=int(os.getenv('FASTF1_CPU_WORKERS', 2)),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker
+        )
+    
+    def _http_sessions(self) -> List:
+        """FastF1's shared requests sessions (plain and cached)"""
+        sessions = [fastf1.Cache._requests_session, fastf1.Cache._requests_session_cached]
+        return [s for s in sessions if s is not None]
+    
+    def _configure_http_pool(self):
+        """Give FastF1's HTTP sessions a larger keep-alive pool and retries on transient errors"""
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        )
+        for session in self._http_sessions():
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+    
+    async def close(self):
+        """Close pooled HTTP connections and worker processes"""
+        if self._http is not None:
+            await self._http.close()
+        for session in self._http_sessions():
+            session.close()
+        self.cpu_pool.shutdown(wait=False, cancel_futures=True)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._round_pool.shutdown(wait=False, cancel_futures=True)
+        app_cache.close()
     
-    def _convert_to_eat(self, utc_time: datetime) -> datetime:
-        """Convert UTC time to East Africa Time (UTC+3)"""
-        if utc_time:
-            return utc_time + self.eat_offset
-        return utc_time
+    async def _jolpica(self, path: str) -> Dict:
+        """GET a Jolpica endpoint (e.g. '2024/driverStandings.json') and return its MRData payload"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=JOLPICA_TIMEOUT))
+        async with self._http.get(f"{JOLPICA_URL}/{path}", params={"limit": 100}) as response:
+            response.raise_for_status()
+            return (await response.json())["MRData"]
     
-    def _format_datetime(self, dt: datetime) -> str:
-        """Format datetime to ISO string"""
-        if dt:
-            return dt.isoformat()
+    async def _cached_payload(self, kind: str, fn, year: int, round: int, session: str, driver: Optional[str]) -> Dict:
+        """Run a telemetry/lap-time fetcher in the process pool, memoized by (kind, year, round, session, driver)"""
+        cache = self._past_payload_cache if year < datetime.now().year else self._payload_cache
+        key = (kind, year, round, session, driver)
+        payload = cache.get(key)
+        if payload is None:
+            pool = self.cpu_pool
+            try:
+                payload = await self._run(fn, year, round, session, driver, executor=pool)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); replace the pool (once, if several calls saw it break) and retry
+                if self.cpu_pool is pool:
+                    logger.warning("Telemetry process pool broken, restarting it")
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self.cpu_pool = self._new_cpu_pool()
+                payload = await self._run(fn, year, round, session, driver, executor=self.cpu_pool)
+            if "error" not in payload:
+                cache[key] = payload
+        return payload
+    
+    async def _run(self, fn, *args, executor=None):
+        """Run a blocking FastF1 call in a worker pool, at most FASTF1_IO_WORKERS at a time"""
+        async with self._sem:
+            return await asyncio.get_running_loop().run_in_executor(executor or self._pool, fn, *args)
+    
+    def invalidate_schedule_cache(self):
+        """Drop memoized schedules so the next call rebuilds them (e.g. after a race concludes)"""
+        self._cached_schedule.cache_clear()
+    
+    def _convert_to_eat(self, utc_time: datetime) -> Optional[datetime]:
+        """Convert UTC time to East Africa Time (UTC+3) as a native datetime"""
+        if pd.notna(utc_time):
+            return pd.Timestamp(utc_time).to_pydatetime() + self.eat_offset
         return None
     
+    def _load_race_sessions(self, year: int, rounds: List[int]) -> List:
+        """Load the race results of each round concurrently, in round order (None for rounds that fail)"""
+        def _load(round_num):
+            try:
+                session = _get_results_session(year, round_num)
+                return round_num, session
+            except Exception as e:
+                logger.warning("Could not load results for round %s: %s", round_num, e)
+                return round_num, None
+        
+        return list(self._round_pool.map(_load, rounds))
+    
+    def _load_session_dates(self, year: int, rounds: List[int]) -> Dict[int, Dict]:
+        """Start dates of FP1/FP2/FP3/Q for each round, looked up concurrently (rounds that fail are left out)"""
+        session_names = ('FP1', 'FP2', 'FP3', 'Q')
+        
+        def _dates(key):
+            round_num, name = key
+            try:
+                return key, fastf1.get_session(year, round_num, name).date
+            except Exception as e:
+                logger.warning("Could not load session times for round %s: %s", round_num, e)
+                return key, e
+        
+        keys = [(round_num, name) for round_num in rounds for name in session_names]
+        found = dict(self._round_pool.map(_dates, keys))
+        
+        return {
+            round_num: {name: found[(round_num, name)] for name in session_names}
+            for round_num in rounds
+            if not any(isinstance(found[(round_num, name)], Exception) for name in session_names)
+        }
+    
     async def get_race_schedule(self, year: int, include_sessions: bool = False) -> List[Dict]:
         """
         Get race schedule for a given year
@@ -48,95 +302,158 @@ class FastF1Service:
             List of race dictionaries with schedule information
         """
         try:
-            logger.info(f"Loading schedule for year {year}")
+            logger.info("Loading schedule for year %s", year)
+            
+            if not include_sessions:
+                try:
+                    return await self._jolpica_schedule(year)
+                except Exception as e:
+                    logger.warning("Jolpica schedule unavailable, falling back to FastF1: %s", e)
             
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            schedule = await loop.run_in_executor(
-                None,
+            # Run in the FastF1 thread pool to avoid blocking
+            schedule = await self._run(
                 self._fetch_schedule_sync,
                 year,
                 include_sessions
             )
             
-            return schedule
+            return [self._public_race(race) for race in schedule]
         except Exception as e:
-            logger.error(f"Error in get_race_schedule: {str(e)}")
+            logger.error("Error in get_race_schedule: %s", e)
             raise
     
+    async def _jolpica_schedule(self, year: int) -> List[Dict]:
+        """Race schedule from Jolpica, in the same shape as the FastF1 schedule (without sessions)"""
+        data = await self._jolpica(f"{year}.json")
+        now_eat = datetime.utcnow() + self.eat_offset
+        
+        races = []
+        for race in data["RaceTable"]["Races"]:
+            location = race["Circuit"]["Location"]
+            race_info = {
+                "round": int(race["round"]),
+                "raceName": race["raceName"],
+                "country": location["country"],
+                "locality": location["locality"],
+                "circuit": location["locality"],
+                "date": race["date"],
+                "year": year
+            }
+            
+            if race.get("time"):
+                race_utc = datetime.fromisoformat(f"{race['date']}T{race['time'].rstrip('Z')}")
+                race_info["time"] = race_utc.strftime('%H:%M:%S')
+                race_info["datetime"] = race_utc + self.eat_offset
+                race_info["datetime_utc"] = race_utc
+                race_dt = race_info["datetime"]
+            else:
+                # Start time not announced yet; default to 14:00 EAT
+                race_info["time"] = "14:00:00"
+                race_info["datetime"] = f"{race['date']}T14:00:00+03:00"
+                race_dt = datetime.fromisoformat(f"{race['date']}T14:00:00")
+            
+            race_info["status"] = "upcoming" if race_dt > now_eat else "done"
+            races.append(race_info)
+        
+        return races
+    
+    @staticmethod
+    def _public_race(race: Dict) -> Dict:
+        """Copy of a schedule entry without private keys (e.g. _race_dt)"""
+        return {k: v for k, v in race.items() if not k.startswith('_')}
+    
     def _fetch_schedule_sync(self, year: int, include_sessions: bool) -> List[Dict]:
         """Synchronous schedule fetching (runs in executor)"""
+        return list(self._cached_schedule(year, include_sessions))
+    
+    def _schedule_tuple(self, year: int, include_sessions: bool) -> tuple:
+        """Immutable schedule for lru_cache"""
+        return tuple(self._build_schedule_sync(year, include_sessions))
+    
+    def _race_starts_eat(self, schedule: pd.DataFrame) -> pd.Series:
+        """Race start of each event in EAT, or 14:00 EAT on the event date when the start time isn't known (NaT if neither is)"""
+        return (schedule['Session5DateUtc'] + self.eat_offset).fillna(
+            schedule['EventDate'].dt.normalize() + pd.Timedelta(hours=14)
+        )
+    
+    def _race_entries(self, schedule: pd.DataFrame, year: int) -> List[Dict]:
+        """Schedule entries for the rows of an event schedule, without sessions or status"""
+        # Race start from the schedule itself (no session.load() needed)
+        race_start = schedule['Session5DateUtc']
+        has_start = race_start.notna()
+        has_date = schedule['EventDate'].notna()
+        event_day = schedule['EventDate'].dt.strftime('%Y-%m-%d')
+        
+        def _native(values: pd.Series) -> pd.Series:
+            """datetime64 column as native datetimes (object dtype) for the JSON encoders"""
+            # Via DatetimeIndex: Series.dt.to_pydatetime() warns on every call under pandas 2.1
+            return pd.Series(pd.DatetimeIndex(values).to_pydatetime(), index=values.index, dtype=object)
+        
+        entries = pd.DataFrame({
+            "round": schedule['RoundNumber'].astype(int),
+            "raceName": schedule['EventName'],
+            "country": schedule['Country'],
+            "locality": schedule['Location'],
+            "circuit": schedule['Location'],
+            "date": race_start.dt.strftime('%Y-%m-%d').where(has_start, event_day),
+            "year": year,
+            "time": race_start.dt.strftime('%H:%M:%S').where(has_start, "14:00:00"),
+            "datetime": _native(race_start + self.eat_offset).where(has_start, event_day + "T14:00:00+03:00"),
+            "datetime_utc": _native(race_start),
+            # Native EAT datetime for status/countdown checks (stripped from API output)
+            "_race_dt": _native(self._race_starts_eat(schedule))
+        })
+        races = entries.to_dict('records')
+        
+        # Rows without a race start carry only the fields they actually have
+        for i in np.flatnonzero(~has_start.to_numpy()):
+            race_info = races[i]
+            del race_info["datetime_utc"]
+            if not has_date.iat[i]:
+                race_info["date"] = None
+                for key in ("time", "datetime", "_race_dt"):
+                    del race_info[key]
+        return races
+    
+    @disk_cached('schedule')
+    def _build_schedule_sync(self, year: int, include_sessions: bool) -> List[Dict]:
+        """Build the schedule from FastF1"""
         try:
             # Get schedule from FastF1
             schedule = fastf1.get_event_schedule(year)
             
-            races = []
-            for idx, event in schedule.iterrows():
-                race_info = {
-                    "round": int(event['RoundNumber']),
-                    "raceName": event['EventName'],
-                    "country": event['Country'],
-                    "locality": event['Location'],
-                    "circuit": event['Location'],
-                    "date": event['EventDate'].strftime('%Y-%m-%d') if pd.notna(event['EventDate']) else None,
-                    "year": year
-                }
-                
-                # Get session times if available
-                try:
-                    # Try to load session data for more accurate times
-                    session = fastf1.get_session(year, event['RoundNumber'], 'R')
-                    session.load()
-                    
-                    if session.date:
-                        race_datetime = session.date
-                        race_info["date"] = race_datetime.strftime('%Y-%m-%d')
-                        race_info["time"] = race_datetime.strftime('%H:%M:%S')
-                        race_info["datetime"] = self._format_datetime(self._convert_to_eat(race_datetime))
-                        race_info["datetime_utc"] = self._format_datetime(race_datetime)
-                    else:
-                        # Fallback to event date
-                        if pd.notna(event['EventDate']):
-                            race_info["time"] = "14:00:00"  # Default time
-                            race_info["datetime"] = f"{race_info['date']}T14:00:00+03:00"
-                except Exception as e:
-                    logger.warning(f"Could not load session data for round {event['RoundNumber']}: {str(e)}")
-                    # Use event date as fallback
-                    if pd.notna(event['EventDate']):
-                        race_info["time"] = "14:00:00"
-                        race_info["datetime"] = f"{race_info['date']}T14:00:00+03:00"
-                
+            races = self._race_entries(schedule, year)
+            
+            if include_sessions:
+                session_dates = self._load_session_dates(year, [race["round"] for race in races])
+            
+            # Race status for every round in one comparison, against the same start as _race_dt
+            race_starts = self._race_starts_eat(schedule)
+            has_start = race_starts.notna().to_numpy()
+            now_eat = datetime.utcnow() + self.eat_offset
+            statuses = np.where(
+                has_start & (race_starts > now_eat).to_numpy(),
+                'upcoming',
+                np.where(has_start, 'done', 'scheduled')
+            )
+            
+            for race_info, status in zip(races, statuses.tolist()):
                 # Add session times if requested
-                if include_sessions:
-                    try:
-                        fp1 = fastf1.get_session(year, event['RoundNumber'], 'FP1')
-                        fp2 = fastf1.get_session(year, event['RoundNumber'], 'FP2')
-                        fp3 = fastf1.get_session(year, event['RoundNumber'], 'FP3')
-                        qual = fastf1.get_session(year, event['RoundNumber'], 'Q')
-                        
-                        race_info["sessions"] = {
-                            "fp1": self._format_datetime(self._convert_to_eat(fp1.date)) if fp1.date else None,
-                            "fp2": self._format_datetime(self._convert_to_eat(fp2.date)) if fp2.date else None,
-                            "fp3": self._format_datetime(self._convert_to_eat(fp3.date)) if fp3.date else None,
-                            "qualifying": self._format_datetime(self._convert_to_eat(qual.date)) if qual.date else None,
-                            "race": race_info.get("datetime")
-                        }
-                    except Exception as e:
-                        logger.warning(f"Could not load session times: {str(e)}")
-                
-                # Determine race status
-                if race_info.get("datetime"):
-                    race_dt = datetime.fromisoformat(race_info["datetime"].replace('+03:00', ''))
-                    now = datetime.now() + self.eat_offset
-                    race_info["status"] = "upcoming" if race_dt > now else "done"
-                else:
-                    race_info["status"] = "scheduled"
+                if include_sessions and race_info["round"] in session_dates:
+                    dates = session_dates[race_info["round"]]
+                    race_info["sessions"] = {
+                        "fp1": self._convert_to_eat(dates['FP1']),
+                        "fp2": self._convert_to_eat(dates['FP2']),
+                        "fp3": self._convert_to_eat(dates['FP3']),
+                        "qualifying": self._convert_to_eat(dates['Q']),
+                        "race": race_info.get("datetime")
+                    }
                 
-                races.append(race_info)
+                race_info["status"] = status
             
             return races
         except Exception as e:
-            logger.error(f"Error fetching schedule: {str(e)}")
+            logger.error("Error fetching schedule: %s", e)
             raise
     
     async def get_race_results(self, year: int, round: Optional[int] = None, latest: bool = False) -> Dict:
@@ -152,9 +469,7 @@ class FastF1Service:
             Dictionary with race results
         """
         try:
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
+            results = await self._run(
                 self._fetch_results_sync,
                 year,
                 round,
@@ -162,40 +477,33 @@ class FastF1Service:
             )
             return results
         except Exception as e:
-            logger.error(f"Error in get_race_results: {str(e)}")
+            logger.error("Error in get_race_results: %s", e)
             raise
     
+    @disk_cached('results')
     def _fetch_results_sync(self, year: int, round: Optional[int], latest: bool) -> Dict:
         """Synchronous results fetching"""
         try:
             if latest:
-                # Get latest completed race
+                # Latest race whose start is already past, straight from the schedule
                 schedule = fastf1.get_event_schedule(year)
-                now = datetime.now()
-                completed_races = []
+                completed = schedule[schedule['Session5DateUtc'] < datetime.utcnow()]
                 
-                for idx, event in schedule.iterrows():
-                    try:
-                        session = fastf1.get_session(year, event['RoundNumber'], 'R')
-                        session.load()
-                        if session.date and session.date < now:
-                            completed_races.append((event['RoundNumber'], session.date))
-                    except:
-                        continue
-                
-                if not completed_races:
+                if completed.empty:
                     return {"error": "No completed races found"}
                 
-                # Get most recent
-                latest_round = max(completed_races, key=lambda x: x[1])[0]
-                round = latest_round
+                round = int(completed.sort_values('Session5DateUtc').iloc[-1]['RoundNumber'])
             
             if not round:
                 return {"error": "Round number required or no completed races found"}
             
+            with self._completed_results_lock:
+                completed = self._completed_results.get((year, round))
+            if completed is not None:
+                return completed
+            
             # Load race session
-            session = fastf1.get_session(year, round, 'R')
-            session.load()
+            session = _get_session(year, round, 'R')
             
             # Get results
             results_df = session.results
@@ -203,157 +511,190 @@ class FastF1Service:
             results = {
                 "year": year,
                 "round": round,
-                "raceName": session.event['EventName'],
-                "country": session.event['Country'],
-                "circuit": session.event['Location'],
-                "date": self._format_datetime(self._convert_to_eat(session.date)) if session.date else None,
+                "raceName": session.event.EventName,
+                "country": session.event.Country,
+                "circuit": session.event.Location,
+                "date": self._convert_to_eat(session.date),
                 "results": []
             }
             
-            for idx, driver in results_df.iterrows():
-                results["results"].append({
-                    "position": int(driver['Position']) if pd.notna(driver['Position']) else None,
-                    "driver": driver['Abbreviation'],
-                    "driverName": driver['FullName'],
-                    "team": driver['TeamName'],
-                    "points": float(driver['Points']) if pd.notna(driver['Points']) else 0,
-                    "time": str(driver['Time']) if pd.notna(driver['Time']) else None,
-                    "status": driver['Status'] if pd.notna(driver['Status']) else None,
-                    "fastestLap": str(driver['FastestLapTime']) if pd.notna(driver['FastestLapTime']) else None
-                })
+            # Convert all rows in one vectorized pass; missing values become None
+            df = results_df[['Position', 'Abbreviation', 'FullName', 'TeamName', 'Points', 'Time', 'Status', 'FastestLapTime']].copy()
+            df['Position'] = df['Position'].astype('Int64').astype(object).where(df['Position'].notna(), None)
+            df['Points'] = df['Points'].fillna(0.0).astype(float)
+            df['Time'] = df['Time'].astype(str).where(df['Time'].notna(), None)
+            df['Status'] = df['Status'].astype(object).where(df['Status'].notna(), None)
+            df['FastestLapTime'] = df['FastestLapTime'].astype(str).where(df['FastestLapTime'].notna(), None)
+            results["results"] = df.rename(columns={
+                'Position': 'position',
+                'Abbreviation': 'driver',
+                'FullName': 'driverName',
+                'TeamName': 'team',
+                'Points': 'points',
+                'Time': 'time',
+                'Status': 'status',
+                'FastestLapTime': 'fastestLap'
+            }).to_dict('records')
+            
+            if pd.notna(session.date) and session.date < datetime.utcnow() - SESSION_FINAL_AFTER:
+                with self._completed_results_lock:
+                    self._completed_results[(year, round)] = results
             
             return results
         except Exception as e:
-            logger.error(f"Error fetching results: {str(e)}")
+            logger.error("Error fetching results: %s", e)
             raise
     
+    def _season_results(self, year: int, after_round: Optional[int]) -> Tuple[pd.DataFrame, List[int]]:
+        """
+        Race results of every round up to after_round (whole season if None) in one DataFrame
+        
+        Returns:
+            The combined results and the rounds whose results could not be loaded
+        """
+        schedule = fastf1.get_event_schedule(year)
+        
+        rounds = []
+        for event in schedule.itertuples(index=False):
+            round_num = int(event.RoundNumber)
+            if after_round and round_num > after_round:
+                break
+            if round_num == 0:
+                continue  # Pre-season testing has no race
+            rounds.append(round_num)
+        
+        frames = []
+        missing = []
+        for round_num, session in self._load_race_sessions(year, rounds):
+            if session is None or session.results is None:
+                missing.append(round_num)
+            else:
+                frames.append(session.results[['Abbreviation', 'FullName', 'TeamName', 'Points', 'Position']])
+        if missing:
+            logger.warning("Standings for %s computed without rounds %s", year, missing)
+        if not frames:
+            return pd.DataFrame(), missing
+        
+        all_results = pd.concat(frames, ignore_index=True)
+        all_results['Points'] = all_results['Points'].fillna(0.0).astype(float)
+        all_results['Win'] = (all_results['Position'] == 1).astype(int)
+        return all_results, missing
+    
+    def _rank_standings(self, standings: pd.DataFrame) -> List[Dict]:
+        """Sort aggregated standings by points and number the positions"""
+        standings = standings.sort_values('points', ascending=False, kind='stable').reset_index(drop=True)
+        standings['position'] = standings.index + 1
+        return standings.to_dict('records')
+    
+    async def _jolpica_standings(self, year: int, after_round: Optional[int], kind: str) -> List[Dict]:
+        """Raw Jolpica standings rows ('driverStandings' or 'constructorStandings') for a season or after a round"""
+        path = f"{year}/{after_round}/{kind}.json" if after_round else f"{year}/{kind}.json"
+        data = await self._jolpica(path)
+        lists = data["StandingsTable"]["StandingsLists"]
+        if not lists:
+            return []
+        return lists[0]["DriverStandings" if kind == 'driverStandings' else "ConstructorStandings"]
+    
+    async def _jolpica_driver_standings(self, year: int, after_round: Optional[int]) -> List[Dict]:
+        """Driver standings from Jolpica, in the same shape as the computed ones"""
+        rows = await self._jolpica_standings(year, after_round, 'driverStandings')
+        return [
+            {
+                "driver": row["Driver"].get("code", row["Driver"]["driverId"]),
+                "driverName": f"{row['Driver']['givenName']} {row['Driver']['familyName']}",
+                "team": row["Constructors"][-1]["name"] if row.get("Constructors") else None,
+                "points": float(row["points"]),
+                "wins": int(row["wins"]),
+                "position": int(row.get("position", i))
+            }
+            for i, row in enumerate(rows, 1)
+        ]
+    
+    async def _jolpica_constructor_standings(self, year: int, after_round: Optional[int]) -> List[Dict]:
+        """Constructor standings from Jolpica, in the same shape as the computed ones"""
+        rows = await self._jolpica_standings(year, after_round, 'constructorStandings')
+        return [
+            {
+                "team": row["Constructor"]["name"],
+                "points": float(row["points"]),
+                "wins": int(row["wins"]),
+                "position": int(row.get("position", i))
+            }
+            for i, row in enumerate(rows, 1)
+        ]
+    
     async def get_driver_standings(self, year: int, after_round: Optional[int] = None) -> List[Dict]:
-        """Get driver championship standings"""
+        """Get driver championship standings (official from Jolpica, computed from FastF1 as a fallback)"""
         try:
-            loop = asyncio.get_event_loop()
-            standings = await loop.run_in_executor(
-                None,
+            try:
+                return await self._jolpica_driver_standings(year, after_round)
+            except Exception as e:
+                logger.warning("Jolpica driver standings unavailable, computing from FastF1: %s", e)
+            
+            standings = await self._run(
                 self._fetch_driver_standings_sync,
                 year,
                 after_round
             )
             return standings
         except Exception as e:
-            logger.error(f"Error in get_driver_standings: {str(e)}")
+            logger.error("Error in get_driver_standings: %s", e)
             raise
     
+    @disk_cached('driver_standings', immutable=True)
     def _fetch_driver_standings_sync(self, year: int, after_round: Optional[int]) -> List[Dict]:
         """Synchronous driver standings fetching"""
         try:
             # FastF1 doesn't have direct standings API, so we calculate from results
-            schedule = fastf1.get_event_schedule(year)
-            driver_points = {}
-            
-            max_round = after_round if after_round else len(schedule)
-            
-            for idx, event in schedule.iterrows():
-                round_num = int(event['RoundNumber'])
-                if after_round and round_num > after_round:
-                    break
-                
-                try:
-                    session = fastf1.get_session(year, round_num, 'R')
-                    session.load()
-                    
-                    if session.results is not None:
-                        for _, driver in session.results.iterrows():
-                            abbrev = driver['Abbreviation']
-                            points = float(driver['Points']) if pd.notna(driver['Points']) else 0
-                            
-                            if abbrev not in driver_points:
-                                driver_points[abbrev] = {
-                                    "driver": abbrev,
-                                    "driverName": driver['FullName'],
-                                    "team": driver['TeamName'],
-                                    "points": 0,
-                                    "wins": 0
-                                }
-                            
-                            driver_points[abbrev]["points"] += points
-                            if driver['Position'] == 1:
-                                driver_points[abbrev]["wins"] += 1
-                except Exception as e:
-                    logger.warning(f"Could not load results for round {round_num}: {str(e)}")
-                    continue
-            
-            # Sort by points
-            standings = sorted(driver_points.values(), key=lambda x: x["points"], reverse=True)
-            
-            # Add position
-            for i, driver in enumerate(standings, 1):
-                driver["position"] = i
-            
-            return standings
+            all_results, missing = self._season_results(year, after_round)
+            standings = []
+            if not all_results.empty:
+                standings = self._rank_standings(all_results.groupby('Abbreviation', sort=False).agg(
+                    driverName=('FullName', 'first'),
+                    team=('TeamName', 'first'),
+                    points=('Points', 'sum'),
+                    wins=('Win', 'sum')
+                ).reset_index().rename(columns={'Abbreviation': 'driver'}))
+            
+            # Rounds that failed to load must not be left out of the cached standings for good
+            return Partial(standings) if missing else standings
         except Exception as e:
-            logger.error(f"Error fetching driver standings: {str(e)}")
+            logger.error("Error fetching driver standings: %s", e)
             raise
     
     async def get_constructor_standings(self, year: int, after_round: Optional[int] = None) -> List[Dict]:
-        """Get constructor championship standings"""
+        """Get constructor championship standings (official from Jolpica, computed from FastF1 as a fallback)"""
         try:
-            loop = asyncio.get_event_loop()
-            standings = await loop.run_in_executor(
-                None,
+            try:
+                return await self._jolpica_constructor_standings(year, after_round)
+            except Exception as e:
+                logger.warning("Jolpica constructor standings unavailable, computing from FastF1: %s", e)
+            
+            standings = await self._run(
                 self._fetch_constructor_standings_sync,
                 year,
                 after_round
             )
             return standings
         except Exception as e:
-            logger.error(f"Error in get_constructor_standings: {str(e)}")
+            logger.error("Error in get_constructor_standings: %s", e)
             raise
     
+    @disk_cached('constructor_standings', immutable=True)
     def _fetch_constructor_standings_sync(self, year: int, after_round: Optional[int]) -> List[Dict]:
         """Synchronous constructor standings fetching"""
         try:
-            schedule = fastf1.get_event_schedule(year)
-            team_points = {}
-            
-            max_round = after_round if after_round else len(schedule)
-            
-            for idx, event in schedule.iterrows():
-                round_num = int(event['RoundNumber'])
-                if after_round and round_num > after_round:
-                    break
-                
-                try:
-                    session = fastf1.get_session(year, round_num, 'R')
-                    session.load()
-                    
-                    if session.results is not None:
-                        for _, driver in session.results.iterrows():
-                            team = driver['TeamName']
-                            points = float(driver['Points']) if pd.notna(driver['Points']) else 0
-                            
-                            if team not in team_points:
-                                team_points[team] = {
-                                    "team": team,
-                                    "points": 0,
-                                    "wins": 0
-                                }
-                            
-                            team_points[team]["points"] += points
-                            if driver['Position'] == 1:
-                                team_points[team]["wins"] += 1
-                except Exception as e:
-                    logger.warning(f"Could not load results for round {round_num}: {str(e)}")
-                    continue
-            
-            # Sort by points
-            standings = sorted(team_points.values(), key=lambda x: x["points"], reverse=True)
-            
-            # Add position
-            for i, team in enumerate(standings, 1):
-                team["position"] = i
-            
-            return standings
+            all_results, missing = self._season_results(year, after_round)
+            standings = []
+            if not all_results.empty:
+                standings = self._rank_standings(all_results.groupby('TeamName', sort=False).agg(
+                    points=('Points', 'sum'),
+                    wins=('Win', 'sum')
+                ).reset_index().rename(columns={'TeamName': 'team'}))
+            
+            return Partial(standings) if missing else standings
         except Exception as e:
-            logger.error(f"Error fetching constructor standings: {str(e)}")
+            logger.error("Error fetching constructor standings: %s", e)
             raise
     
     async def get_telemetry(self, year: int, round: int, session: str, driver: Optional[str] = None) -> Dict:
@@ -370,9 +711,8 @@ class FastF1Service:
             Dictionary with telemetry data
         """
         try:
-            loop = asyncio.get_event_loop()
-            telemetry = await loop.run_in_executor(
-                None,
+            telemetry = await self._cached_payload(
+                'telemetry',
                 self._fetch_telemetry_sync,
                 year,
                 round,
@@ -381,14 +721,26 @@ class FastF1Service:
             )
             return telemetry
         except Exception as e:
-            logger.error(f"Error in get_telemetry: {str(e)}")
+            logger.error("Error in get_telemetry: %s", e)
             raise
     
-    def _fetch_telemetry_sync(self, year: int, round: int, session: str, driver: Optional[str]) -> Dict:
-        """Synchronous telemetry fetching"""
+    @staticmethod
+    def _telemetry_channel(telemetry: pd.DataFrame, column: str, dtype: str):
+        """One telemetry channel as a compact numpy array (Time in integer milliseconds)"""
+        if column not in telemetry.columns:
+            return np.array([], dtype=dtype)
+        values = telemetry[column]
+        if column == 'Time':
+            return values.to_numpy(dtype='timedelta64[ns]').astype('int64') // 1_000_000
+        if np.issubdtype(np.dtype(dtype), np.integer):
+            values = values.fillna(0)
+        return values.to_numpy().astype(dtype, copy=False)
+    
+    @staticmethod
+    def _fetch_telemetry_sync(year: int, round: int, session: str, driver: Optional[str]) -> Dict:
+        """Synchronous telemetry fetching (runs in a worker process)"""
         try:
-            sess = fastf1.get_session(year, round, session)
-            sess.load()
+            sess = _get_session(year, round, session)
             
             if driver:
                 # Get specific driver telemetry
@@ -402,13 +754,8 @@ class FastF1Service:
                     "driver": driver,
                     "laps": len(driver_laps),
                     "telemetry": {
-                        "time": telemetry['Time'].tolist() if 'Time' in telemetry.columns else [],
-                        "speed": telemetry['Speed'].tolist() if 'Speed' in telemetry.columns else [],
-                        "rpm": telemetry['RPM'].tolist() if 'RPM' in telemetry.columns else [],
-                        "throttle": telemetry['Throttle'].tolist() if 'Throttle' in telemetry.columns else [],
-                        "brake": telemetry['Brake'].tolist() if 'Brake' in telemetry.columns else [],
-                        "gear": telemetry['nGear'].tolist() if 'nGear' in telemetry.columns else [],
-                        "drs": telemetry['DRS'].tolist() if 'DRS' in telemetry.columns else []
+                        name: FastF1Service._telemetry_channel(telemetry, column, dtype)
+                        for name, (column, dtype) in TELEMETRY_CHANNELS.items()
                     }
                 }
             else:
@@ -419,15 +766,14 @@ class FastF1Service:
                     "message": "Specify a driver to get detailed telemetry"
                 }
         except Exception as e:
-            logger.error(f"Error fetching telemetry: {str(e)}")
+            logger.error("Error fetching telemetry: %s", e)
             raise
     
     async def get_lap_times(self, year: int, round: int, session: str, driver: Optional[str] = None) -> Dict:
         """Get lap times for a specific session"""
         try:
-            loop = asyncio.get_event_loop()
-            lap_times = await loop.run_in_executor(
-                None,
+            lap_times = await self._cached_payload(
+                'lap_times',
                 self._fetch_lap_times_sync,
                 year,
                 round,
@@ -436,27 +782,27 @@ class FastF1Service:
             )
             return lap_times
         except Exception as e:
-            logger.error(f"Error in get_lap_times: {str(e)}")
+            logger.error("Error in get_lap_times: %s", e)
             raise
     
-    def _fetch_lap_times_sync(self, year: int, round: int, session: str, driver: Optional[str]) -> Dict:
-        """Synchronous lap times fetching"""
+    @staticmethod
+    def _fetch_lap_times_sync(year: int, round: int, session: str, driver: Optional[str]) -> Dict:
+        """Synchronous lap times fetching (runs in a worker process)"""
         try:
-            sess = fastf1.get_session(year, round, session)
-            sess.load()
+            sess = _get_session(year, round, session)
             
             if driver:
                 driver_laps = sess.laps.pick_driver(driver)
                 laps_data = []
-                for idx, lap in driver_laps.iterrows():
+                for lap in driver_laps.itertuples(index=False):
                     laps_data.append({
-                        "lap": int(lap['LapNumber']) if pd.notna(lap['LapNumber']) else None,
-                        "time": str(lap['LapTime']) if pd.notna(lap['LapTime']) else None,
-                        "sector1": str(lap['Sector1Time']) if pd.notna(lap['Sector1Time']) else None,
-                        "sector2": str(lap['Sector2Time']) if pd.notna(lap['Sector2Time']) else None,
-                        "sector3": str(lap['Sector3Time']) if pd.notna(lap['Sector3Time']) else None,
-                        "compound": lap['Compound'] if pd.notna(lap['Compound']) else None,
-                        "tyreAge": int(lap['TyreLife']) if pd.notna(lap['TyreLife']) else None
+                        "lap": int(lap.LapNumber) if pd.notna(lap.LapNumber) else None,
+                        "time": str(lap.LapTime) if pd.notna(lap.LapTime) else None,
+                        "sector1": str(lap.Sector1Time) if pd.notna(lap.Sector1Time) else None,
+                        "sector2": str(lap.Sector2Time) if pd.notna(lap.Sector2Time) else None,
+                        "sector3": str(lap.Sector3Time) if pd.notna(lap.Sector3Time) else None,
+                        "compound": lap.Compound if pd.notna(lap.Compound) else None,
+                        "tyreAge": int(lap.TyreLife) if pd.notna(lap.TyreLife) else None
                     })
                 
                 return {
@@ -464,65 +810,75 @@ class FastF1Service:
                     "laps": laps_data
                 }
             else:
-                # Get all drivers
-                all_laps = sess.laps
-                drivers_summary = {}
-                
-                for drv in sess.results['Abbreviation']:
-                    driver_laps = all_laps.pick_driver(drv)
-                    if len(driver_laps) > 0:
-                        best_lap = driver_laps.pick_fastest()
-                        drivers_summary[drv] = {
-                            "totalLaps": len(driver_laps),
-                            "bestLap": str(best_lap['LapTime'].iloc[0]) if pd.notna(best_lap['LapTime'].iloc[0]) else None
-                        }
+                # Summarise every driver's laps in one groupby pass
+                lap_groups = sess.laps.groupby('Driver')['LapTime']
+                totals = lap_groups.size()
+                bests = lap_groups.min()
+                drivers_summary = {
+                    drv: {
+                        "totalLaps": int(totals[drv]),
+                        "bestLap": str(bests[drv]) if pd.notna(bests[drv]) else None
+                    }
+                    for drv in sess.results['Abbreviation'] if drv in totals.index
+                }
                 
                 return {
                     "drivers": drivers_summary
                 }
         except Exception as e:
-            logger.error(f"Error fetching lap times: {str(e)}")
+            logger.error("Error fetching lap times: %s", e)
             raise
     
+    def _fetch_next_race_sync(self, year: int) -> Optional[Dict]:
+        """Next race of a season straight from the event schedule (None if the season is over)"""
+        schedule = fastf1.get_event_schedule(year)
+        now_utc = datetime.utcnow()
+        
+        upcoming = schedule[schedule['Session5DateUtc'] > now_utc].sort_values('Session5DateUtc')
+        if upcoming.empty:
+            return None
+        
+        race = self._race_entries(upcoming.head(1), year)[0]
+        race["status"] = "upcoming"
+        race_dt = race.pop("_race_dt")
+        until = race_dt - (now_utc + self.eat_offset)
+        return {
+            "race": race,
+            "countdown": {
+                "days": until.days,
+                "hours": until.seconds // 3600,
+                "minutes": (until.seconds % 3600) // 60,
+                "seconds": until.seconds % 60,
+                "total_seconds": int(until.total_seconds())
+            }
+        }
+    
     async def get_next_race(self) -> Dict:
         """Get information about the next upcoming race"""
         try:
             current_year = datetime.now().year
-            schedule = await self.get_race_schedule(current_year)
-            
-            now = datetime.now() + self.eat_offset
-            
-            for race in schedule:
-                if race.get("datetime"):
-                    try:
-                        race_dt = datetime.fromisoformat(race["datetime"].replace('+03:00', ''))
-                        if race_dt > now:
-                            return {
-                                "race": race,
-                                "countdown": {
-                                    "days": (race_dt - now).days,
-                                    "hours": (race_dt - now).seconds // 3600,
-                                    "minutes": ((race_dt - now).seconds % 3600) // 60,
-                                    "seconds": (race_dt - now).seconds % 60,
-                                    "total_seconds": int((race_dt - now).total_seconds())
-                                }
-                            }
-                    except:
-                        continue
+            next_race = await self._run(
+                self._fetch_next_race_sync,
+                current_year
+            )
+            if next_race:
+                return next_race
             
             # If no upcoming race in current year, check next year
-            next_year = current_year + 1
-            schedule_next = await self.get_race_schedule(next_year)
-            if schedule_next:
+            next_race = await self._run(
+                self._fetch_next_race_sync,
+                current_year + 1
+            )
+            if next_race:
                 return {
-                    "race": schedule_next[0],
+                    "race": next_race["race"],
                     "countdown": None,
                     "message": "Next race is in next season"
                 }
             
             return {"error": "No upcoming race found"}
         except Exception as e:
-            logger.error(f"Error getting next race: {str(e)}")
+            logger.error("Error getting next race: %s", e)
             raise
     
     async def get_race_info(self, year: int, round: int, session: str = 'R') -> Dict:
@@ -530,9 +886,7 @@ class FastF1Service:
         Get comprehensive race information including timing, track status, session status, etc.
         """
         try:
-            loop = asyncio.get_event_loop()
-            race_info = await loop.run_in_executor(
-                None,
+            race_info = await self._run(
                 self._fetch_race_info_sync,
                 year,
                 round,
@@ -540,24 +894,23 @@ class FastF1Service:
             )
             return race_info
         except Exception as e:
-            logger.error(f"Error in get_race_info: {str(e)}")
+            logger.error("Error in get_race_info: %s", e)
             raise
     
     def _fetch_race_info_sync(self, year: int, round: int, session: str) -> Dict:
         """Synchronous race info fetching"""
         try:
-            sess = fastf1.get_session(year, round, session)
-            sess.load()
+            sess = _get_session(year, round, session)
             
             race_info = {
                 "year": year,
                 "round": round,
                 "session": session,
-                "event_name": sess.event['EventName'] if hasattr(sess, 'event') else None,
-                "country": sess.event['Country'] if hasattr(sess, 'event') else None,
-                "location": sess.event['Location'] if hasattr(sess, 'event') else None,
-                "circuit": sess.event['Location'] if hasattr(sess, 'event') else None,
-                "date": self._format_datetime(self._convert_to_eat(sess.date)) if sess.date else None,
+                "event_name": sess.event.EventName if hasattr(sess, 'event') else None,
+                "country": sess.event.Country if hasattr(sess, 'event') else None,
+                "location": sess.event.Location if hasattr(sess, 'event') else None,
+                "circuit": sess.event.Location if hasattr(sess, 'event') else None,
+                "date": self._convert_to_eat(sess.date),
             }
             
             # Session Status
@@ -570,38 +923,39 @@ class FastF1Service:
             if hasattr(sess, 'track_status'):
                 track_status = sess.track_status
                 if track_status is not None and len(track_status) > 0:
+                    columns = track_status.to_dict('list')
                     race_info["track_status"] = {
-                        "status": track_status['Status'].tolist() if 'Status' in track_status.columns else [],
-                        "time": track_status['Time'].tolist() if 'Time' in track_status.columns else [],
-                        "message": track_status['Message'].tolist() if 'Message' in track_status.columns else []
+                        "status": columns.get('Status', []),
+                        "time": columns.get('Time', []),
+                        "message": columns.get('Message', [])
                     }
             
             # Race Control Messages
             if hasattr(sess, 'race_control_messages'):
                 messages = sess.race_control_messages
                 if messages is not None and len(messages) > 0:
-                    race_info["race_control_messages"] = [
-                        {
-                            "time": str(msg.get('Time', '')) if isinstance(msg, dict) else str(msg),
-                            "message": str(msg.get('Message', '')) if isinstance(msg, dict) else str(msg),
-                            "category": str(msg.get('Category', '')) if isinstance(msg, dict) else None
-                        }
-                        for msg in messages.to_dict('records') if hasattr(messages, 'to_dict')
-                    ] or []
+                    # Stringify whole columns, then emit the rows in one pass
+                    race_info["race_control_messages"] = (
+                        messages.reindex(columns=['Time', 'Message', 'Category'], fill_value='')
+                        .astype(str)
+                        .rename(columns={'Time': 'time', 'Message': 'message', 'Category': 'category'})
+                        .to_dict('records')
+                    )
             
             # Timing Data (Laps)
             if hasattr(sess, 'laps') and sess.laps is not None:
                 laps = sess.laps
                 if len(laps) > 0:
                     # Get summary of all drivers' laps
+                    lap_stats = laps.groupby('Driver')['LapTime'].agg(['size', 'min', 'mean'])
                     drivers_summary = {}
                     for driver in sess.results['Abbreviation'] if hasattr(sess, 'results') and sess.results is not None else []:
-                        driver_laps = laps.pick_driver(driver)
-                        if len(driver_laps) > 0:
+                        if driver in lap_stats.index:
+                            stats = lap_stats.loc[driver]
                             drivers_summary[driver] = {
-                                "total_laps": len(driver_laps),
-                                "best_lap_time": str(driver_laps.pick_fastest()['LapTime'].iloc[0]) if len(driver_laps.pick_fastest()) > 0 else None,
-                                "average_lap_time": str(driver_laps['LapTime'].mean()) if 'LapTime' in driver_laps.columns else None
+                                "total_laps": int(stats['size']),
+                                "best_lap_time": str(stats['min']) if pd.notna(stats['min']) else None,
+                                "average_lap_time": str(stats['mean'])
                             }
                     race_info["timing_data"] = {
                         "drivers": drivers_summary,
@@ -621,15 +975,13 @@ class FastF1Service:
             
             return race_info
         except Exception as e:
-            logger.error(f"Error fetching race info: {str(e)}")
+            logger.error("Error fetching race info: %s", e)
             raise
     
     async def get_track_status(self, year: int, round: int, session: str = 'R') -> Dict:
         """Get track status (flags, safety car, etc.)"""
         try:
-            loop = asyncio.get_event_loop()
-            status = await loop.run_in_executor(
-                None,
+            status = await self._run(
                 self._fetch_track_status_sync,
                 year,
                 round,
@@ -637,23 +989,22 @@ class FastF1Service:
             )
             return status
         except Exception as e:
-            logger.error(f"Error in get_track_status: {str(e)}")
+            logger.error("Error in get_track_status: %s", e)
             raise
     
     def _fetch_track_status_sync(self, year: int, round: int, session: str) -> Dict:
         """Synchronous track status fetching"""
         try:
-            sess = fastf1.get_session(year, round, session)
-            sess.load()
+            sess = _get_session(year, round, session)
             
             if hasattr(sess, 'track_status') and sess.track_status is not None:
                 track_status = sess.track_status
                 return {
                     "statuses": track_status.to_dict('records') if hasattr(track_status, 'to_dict') else [],
-                    "current_status": str(track_status['Status'].iloc[-1]) if len(track_status) > 0 and 'Status' in track_status.columns else None
+                    "current_status": str(track_status['Status'].iat[-1]) if len(track_status) > 0 and 'Status' in track_status.columns else None
                 }
             return {"statuses": [], "current_status": None}
         except Exception as e:
-            logger.error(f"Error fetching track status: {str(e)}")
+            logger.error("Error fetching track status: %s", e)
             raise
 